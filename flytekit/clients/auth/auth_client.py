@@ -4,15 +4,14 @@ import base64 as _base64
 import hashlib as _hashlib
 import http.server as _BaseHTTPServer
 import logging
-import multiprocessing
-import os as _os
-import re as _re
+import queue as _queue
+import secrets as _secrets
+import threading
 import typing
 import urllib.parse as _urlparse
 import webbrowser as _webbrowser
 from dataclasses import dataclass
 from http import HTTPStatus as _StatusCodes
-from multiprocessing import get_context
 from urllib.parse import urlencode as _urlencode
 
 import requests as _requests
@@ -30,23 +29,15 @@ def _generate_code_verifier():
     """
     Generates a 'code_verifier' as described in https://tools.ietf.org/html/rfc7636#section-4.1
     Adapted from https://github.com/openstack/deb-python-oauth2client/blob/master/oauth2client/_pkce.py.
+    The verifier is the unpadded urlsafe base64 encoding of _code_verifier_length random bytes, which only uses
+    characters allowed by the RFC and is always 86 characters long, well within the required 43-128 range.
     :return str:
     """
-    code_verifier = _base64.urlsafe_b64encode(_os.urandom(_code_verifier_length)).decode(_utf_8)
-    # Eliminate invalid characters.
-    code_verifier = _re.sub(r"[^a-zA-Z0-9_\-.~]+", "", code_verifier)
-    if len(code_verifier) < 43:
-        raise ValueError("Verifier too short. number of bytes must be > 30.")
-    elif len(code_verifier) > 128:
-        raise ValueError("Verifier too long. number of bytes must be < 97.")
-    return code_verifier
+    return _secrets.token_urlsafe(_code_verifier_length)
 
 
 def _generate_state_parameter():
-    state = _base64.urlsafe_b64encode(_os.urandom(_random_seed_length)).decode(_utf_8)
-    # Eliminate invalid characters.
-    code_verifier = _re.sub("[^a-zA-Z0-9-_.,]+", "", state)
-    return code_verifier
+    return _secrets.token_urlsafe(_random_seed_length)
 
 
 def _create_code_challenge(code_verifier):
@@ -95,20 +86,18 @@ class OAuthCallbackHandler(_BaseHTTPServer.BaseHTTPRequestHandler):
 
     def do_GET(self):
         url = _urlparse.urlparse(self.path)
-        if url.path.strip("/") == self.server.redirect_path.strip("/"):
+        if url.path.strip("/") == self.server.stripped_redirect_path:
             self.send_response(_StatusCodes.OK)
             self.send_header("Content-type", "text/html")
             self.end_headers()
-            self.handle_login(dict(_urlparse.parse_qsl(url.query)))
+            query = _urlparse.parse_qs(url.query)
+            self.server.handle_authorization_code(AuthorizationCode(query["code"][0], query["state"][0]))
             if self.server.remote_metadata.success_html is None:
                 self.wfile.write(bytes(get_default_success_html(self.server.remote_metadata.endpoint), "utf-8"))
             self.wfile.flush()
         else:
             self.send_response(_StatusCodes.NOT_FOUND)
 
-    def handle_login(self, data: dict):
-        self.server.handle_authorization_code(AuthorizationCode(data["code"], data["state"]))
-
 
 class OAuthHTTPServer(_BaseHTTPServer.HTTPServer):
     """
@@ -123,10 +112,11 @@ class OAuthHTTPServer(_BaseHTTPServer.HTTPServer):
         request_handler_class: typing.Type[_BaseHTTPServer.BaseHTTPRequestHandler],
         bind_and_activate: bool = True,
         redirect_path: str = None,
-        queue: multiprocessing.Queue = None,
+        queue: _queue.Queue = None,
     ):
         _BaseHTTPServer.HTTPServer.__init__(self, server_address, request_handler_class, bind_and_activate)
         self._redirect_path = redirect_path
+        self._stripped_redirect_path = redirect_path.strip("/") if redirect_path else ""
         self._remote_metadata = remote_metadata
         self._auth_code = None
         self._queue = queue
@@ -135,6 +125,10 @@ class OAuthHTTPServer(_BaseHTTPServer.HTTPServer):
     def redirect_path(self) -> str:
         return self._redirect_path
 
+    @property
+    def stripped_redirect_path(self) -> str:
+        return self._stripped_redirect_path
+
     @property
     def remote_metadata(self) -> EndpointMetadata:
         return self._remote_metadata
@@ -143,7 +137,7 @@ class OAuthHTTPServer(_BaseHTTPServer.HTTPServer):
         self._queue.put(auth_code)
         self.server_close()
 
-    def handle_request(self, queue: multiprocessing.Queue = None) -> typing.Any:
+    def handle_request(self, queue: _queue.Queue = None) -> typing.Any:
         self._queue = queue
         return super().handle_request()
 
@@ -154,6 +148,7 @@ class _SingletonPerEndpoint(type):
     """
 
     _instances: typing.Dict[str, AuthorizationClient] = {}
+    _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         endpoint = ""
@@ -163,9 +158,16 @@ class _SingletonPerEndpoint(type):
             endpoint = kwargs["auth_endpoint"]
         else:
             raise ValueError("parameter auth_endpoint is required")
-        if endpoint not in cls._instances:
-            cls._instances[endpoint] = super(_SingletonPerEndpoint, cls).__call__(*args, **kwargs)
-        return cls._instances[endpoint]
+        instance = cls._instances.get(endpoint)
+        if instance is not None:
+            return instance
+        with cls._lock:
+            # Another thread may have created the client while we were waiting on the lock.
+            instance = cls._instances.get(endpoint)
+            if instance is None:
+                instance = super(_SingletonPerEndpoint, cls).__call__(*args, **kwargs)
+                cls._instances[endpoint] = instance
+        return instance
 
 
 class AuthorizationClient(metaclass=_SingletonPerEndpoint):
@@ -220,6 +222,9 @@ class AuthorizationClient(metaclass=_SingletonPerEndpoint):
         self._state = state
         self._verify = verify
         self._headers = {"content-type": "application/x-www-form-urlencoded"}
+        # Reuse a single session, so that the token and refresh requests share pooled connections.
+        self._session = _requests.Session()
+        self._session.headers.update(self._headers)
 
         self._params = {
             "client_id": client_id,  # This must match the Client ID of the OAuth application.
@@ -233,6 +238,8 @@ class AuthorizationClient(metaclass=_SingletonPerEndpoint):
             "code_challenge": code_challenge,
             "code_challenge_method": "S256",
         }
+        scheme, netloc, path, _, _, _ = _urlparse.urlparse(self._auth_endpoint)
+        self._auth_url = _urlparse.urlunparse((scheme, netloc, path, None, _urlencode(self._params), None))
 
     def __repr__(self):
         return f"AuthorizationClient({self._auth_endpoint}, {self._token_endpoint}, {self._client_id}, {self._scopes}, {self._redirect_uri})"
@@ -248,11 +255,8 @@ class AuthorizationClient(metaclass=_SingletonPerEndpoint):
         )
 
     def _request_authorization_code(self):
-        scheme, netloc, path, _, _, _ = _urlparse.urlparse(self._auth_endpoint)
-        query = _urlencode(self._params)
-        endpoint = _urlparse.urlunparse((scheme, netloc, path, None, query, None))
-        logging.debug(f"Requesting authorization code through {endpoint}")
-        _webbrowser.open_new_tab(endpoint)
+        logging.debug(f"Requesting authorization code through {self._auth_url}")
+        _webbrowser.open_new_tab(self._auth_url)
 
     def _credentials_from_response(self, auth_token_resp) -> Credentials:
         """
@@ -278,18 +282,16 @@ class AuthorizationClient(metaclass=_SingletonPerEndpoint):
     def _request_access_token(self, auth_code) -> Credentials:
         if self._state != auth_code.state:
             raise ValueError(f"Unexpected state parameter [{auth_code.state}] passed")
-        self._params.update(
-            {
-                "code": auth_code.code,
-                "code_verifier": self._code_verifier,
-                "grant_type": "authorization_code",
-            }
-        )
+        token_body = {
+            **self._params,
+            "code": auth_code.code,
+            "code_verifier": self._code_verifier,
+            "grant_type": "authorization_code",
+        }
 
-        resp = _requests.post(
+        resp = self._session.post(
             url=self._token_endpoint,
-            data=self._params,
-            headers=self._headers,
+            data=token_body,
             allow_redirects=False,
             verify=self._verify,
         )
@@ -307,17 +309,15 @@ class AuthorizationClient(metaclass=_SingletonPerEndpoint):
         retrieve credentials
         """
         # In the absence of globally-set token values, initiate the token request flow
-        ctx = get_context("fork")
-        q = ctx.Queue()
+        q = _queue.Queue()
 
         # First prepare the callback server in the background
         server = self._create_callback_server()
 
-        server_process = ctx.Process(target=server.handle_request, args=(q,))
-        server_process.daemon = True
+        server_thread = threading.Thread(target=server.handle_request, args=(q,), daemon=True)
 
         try:
-            server_process.start()
+            server_thread.start()
 
             # Send the call to request the authorization code in the background
             self._request_authorization_code()
@@ -326,20 +326,20 @@ class AuthorizationClient(metaclass=_SingletonPerEndpoint):
             auth_code = q.get()
             return self._request_access_token(auth_code)
         finally:
-            server_process.terminate()
+            # The server only ever serves a single request, so closing its socket is enough to release it.
+            server.server_close()
 
     def refresh_access_token(self, credentials: Credentials) -> Credentials:
         if credentials.refresh_token is None:
             raise ValueError("no refresh token available with which to refresh authorization credentials")
 
-        resp = _requests.post(
+        resp = self._session.post(
             url=self._token_endpoint,
             data={
                 "grant_type": "refresh_token",
                 "client_id": self._client_id,
                 "refresh_token": credentials.refresh_token,
             },
-            headers=self._headers,
             allow_redirects=False,
             verify=self._verify,
         )
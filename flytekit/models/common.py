@@ -41,6 +41,8 @@ class FlyteType(FlyteABCMeta):
 
 
 class FlyteIdlEntity(object, metaclass=FlyteType):
+    __slots__ = ()
+
     def __eq__(self, other):
         return isinstance(other, FlyteIdlEntity) and other.to_flyte_idl() == self.to_flyte_idl()
 
@@ -11,6 +11,8 @@ from flytekit.models.core import identifier as _identifier
 
 
 class LaunchPlanMetadata(_common.FlyteIdlEntity):
+    __slots__ = ("_schedule", "_notifications")
+
     def __init__(self, schedule, notifications):
         """
 
@@ -62,6 +64,8 @@ class LaunchPlanMetadata(_common.FlyteIdlEntity):
 
 
 class Auth(_common.FlyteIdlEntity):
+    __slots__ = ("_assumable_iam_role", "_kubernetes_service_account")
+
     def __init__(self, assumable_iam_role=None, kubernetes_service_account=None):
         """
         DEPRECATED. Do not use. Use flytekit.models.common.AuthRole instead
@@ -111,6 +115,19 @@ class Auth(_common.FlyteIdlEntity):
 
 
 class LaunchPlanSpec(_common.FlyteIdlEntity):
+    __slots__ = (
+        "_workflow_id",
+        "_entity_metadata",
+        "_default_inputs",
+        "_fixed_inputs",
+        "_labels",
+        "_annotations",
+        "_auth_role",
+        "_raw_output_data_config",
+        "_max_parallelism",
+        "_security_context",
+    )
+
     def __init__(
         self,
         workflow_id,
@@ -280,21 +297,20 @@ class LaunchPlanState(object):
     INACTIVE = _launch_plan.INACTIVE
     ACTIVE = _launch_plan.ACTIVE
 
+    _STATE_NAMES = {INACTIVE: "INACTIVE", ACTIVE: "ACTIVE"}
+
     @classmethod
     def enum_to_string(cls, val):
         """
         :param int val:
         :rtype: Text
         """
-        if val == cls.INACTIVE:
-            return "INACTIVE"
-        elif val == cls.ACTIVE:
-            return "ACTIVE"
-        else:
-            return "<UNKNOWN>"
+        return cls._STATE_NAMES.get(val, "<UNKNOWN>")
 
 
 class LaunchPlanClosure(_common.FlyteIdlEntity):
+    __slots__ = ("_state", "_expected_inputs", "_expected_outputs")
+
     def __init__(self, state, expected_inputs, expected_outputs):
         """
         :param LaunchPlanState state: Indicate the Launch plan phase
@@ -351,6 +367,8 @@ class LaunchPlanClosure(_common.FlyteIdlEntity):
 
 
 class LaunchPlan(_common.FlyteIdlEntity):
+    __slots__ = ("_id", "_spec", "_closure")
+
     def __init__(self, id, spec, closure):
         """
         :param flytekit.models.core.identifier.Identifier id:
@@ -1,14 +1,21 @@
 import http.server as _BaseHTTPServer
+import io
 import re
-from multiprocessing import Queue as _Queue
+from http import HTTPStatus
+from queue import Queue as _Queue
+from unittest.mock import MagicMock, patch
 
 from flytekit.clients.auth.auth_client import (
+    AuthorizationClient,
+    AuthorizationCode,
     EndpointMetadata,
+    OAuthCallbackHandler,
     OAuthHTTPServer,
     _create_code_challenge,
     _generate_code_verifier,
     _generate_state_parameter,
 )
+from flytekit.clients.auth.keyring import Credentials
 
 
 def test_generate_code_verifier():
@@ -40,3 +47,90 @@ def test_oauth_http_server():
     server.handle_authorization_code(test_auth_code)
     auth_code = queue.get()
     assert test_auth_code == auth_code
+
+
+def _callback_handler(path: str, queue: _Queue) -> OAuthCallbackHandler:
+    server = OAuthHTTPServer(
+        ("localhost", 0),
+        remote_metadata=EndpointMetadata(endpoint="example.com"),
+        request_handler_class=OAuthCallbackHandler,
+        redirect_path="/callback",
+        queue=queue,
+    )
+    handler = OAuthCallbackHandler.__new__(OAuthCallbackHandler)
+    handler.server = server
+    handler.path = path
+    handler.wfile = io.BytesIO()
+    handler.send_response = MagicMock()
+    handler.send_header = MagicMock()
+    handler.end_headers = MagicMock()
+    return handler
+
+
+def test_oauth_callback_handler_do_get():
+    queue = _Queue()
+    handler = _callback_handler("/callback/?code=c&state=s", queue)
+    handler.do_GET()
+
+    handler.send_response.assert_called_once_with(HTTPStatus.OK)
+    auth_code = queue.get_nowait()
+    assert auth_code.code == "c"
+    assert auth_code.state == "s"
+    assert b"example.com" in handler.wfile.getvalue()
+
+
+def test_oauth_callback_handler_do_get_not_found():
+    queue = _Queue()
+    handler = _callback_handler("/other?code=c&state=s", queue)
+    try:
+        handler.do_GET()
+    finally:
+        handler.server.server_close()
+
+    handler.send_response.assert_called_once_with(HTTPStatus.NOT_FOUND)
+    assert queue.empty()
+
+
+def test_refresh_access_token():
+    client = AuthorizationClient(
+        "refresh.example.com",
+        auth_endpoint="https://refresh.example.com/oauth2/authorize",
+        token_endpoint="https://refresh.example.com/oauth2/token",
+        client_id="client",
+        redirect_uri="http://localhost:53593/callback",
+        verify=False,
+    )
+    with patch.object(client._session, "post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"access_token": "new", "refresh_token": "r", "expires_in": 60}
+        creds = client.refresh_access_token(Credentials(access_token="old", refresh_token="r"))
+
+    assert creds.access_token == "new"
+    _, kwargs = mock_post.call_args
+    assert kwargs["url"] == "https://refresh.example.com/oauth2/token"
+    assert kwargs["data"] == {"grant_type": "refresh_token", "client_id": "client", "refresh_token": "r"}
+    assert kwargs["verify"] is False
+
+
+def test_request_access_token_does_not_mutate_params():
+    client = AuthorizationClient(
+        "token.example.com",
+        auth_endpoint="https://token.example.com/oauth2/authorize",
+        token_endpoint="https://token.example.com/oauth2/token",
+        client_id="client",
+        redirect_uri="http://localhost:53593/callback",
+    )
+    with patch.object(client._session, "post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {"access_token": "a", "refresh_token": "r", "expires_in": 60}
+        client._request_access_token(AuthorizationCode("the_code", client._state))
+
+    assert "code" not in client._params
+    assert "grant_type" not in client._params
+    assert "the_code" not in client._auth_url
+    assert "grant_type" not in client._auth_url
+
+    _, kwargs = mock_post.call_args
+    assert kwargs["data"]["code"] == "the_code"
+    assert kwargs["data"]["code_verifier"] == client._code_verifier
+    assert kwargs["data"]["grant_type"] == "authorization_code"
@@ -127,3 +127,49 @@ def test_old_style_role():
     lp_spec = launch_plan.LaunchPlanSpec.from_flyte_idl(old_style_spec)
 
     assert lp_spec.auth_role.assumable_iam_role == "my:service:account"
+
+
+def test_launch_plan_state_enum_to_string():
+    assert launch_plan.LaunchPlanState.enum_to_string(launch_plan.LaunchPlanState.ACTIVE) == "ACTIVE"
+    assert launch_plan.LaunchPlanState.enum_to_string(launch_plan.LaunchPlanState.INACTIVE) == "INACTIVE"
+    assert launch_plan.LaunchPlanState.enum_to_string(-1) == "<UNKNOWN>"
+
+
+def test_to_flyte_idl_is_not_shared():
+    identifier_model = identifier.Identifier(identifier.ResourceType.LAUNCH_PLAN, "project", "domain", "name", "v")
+    metadata = launch_plan.LaunchPlanMetadata(schedule=schedule.Schedule("asdf", "1 3 4 5 6 7"), notifications=[])
+    v = interface.Variable(types.LiteralType(simple=types.SimpleType.BOOLEAN), "asdf asdf asdf")
+    parameter_map = interface.ParameterMap({"ppp": interface.Parameter(var=v)})
+    labels = common.Labels({})
+    spec = launch_plan.LaunchPlanSpec(
+        identifier_model,
+        metadata,
+        parameter_map,
+        literals.LiteralMap({}),
+        labels,
+        common.Annotations({}),
+        common.AuthRole(assumable_iam_role="my:iam:role"),
+        common.RawOutputDataConfig("s3://bucket"),
+    )
+    closure = launch_plan.LaunchPlanClosure(
+        state=launch_plan.LaunchPlanState.ACTIVE,
+        expected_inputs=parameter_map,
+        expected_outputs=interface.VariableMap({"vvv": v}),
+    )
+    auth = launch_plan.Auth(assumable_iam_role="my:iam:role")
+    lp = launch_plan.LaunchPlan(identifier_model, spec, closure)
+
+    for obj in (metadata, auth, spec, closure, lp):
+        first = obj.to_flyte_idl()
+        second = obj.to_flyte_idl()
+        assert first == second
+        assert first is not second
+
+    # Mutating a returned message must not leak back into the model.
+    pb = spec.to_flyte_idl()
+    pb.workflow_id.version = "X"
+    assert spec.to_flyte_idl().workflow_id.version == "v"
+
+    # Changes to child models are reflected in later serializations.
+    labels.values["team"] = "x"
+    assert spec.to_flyte_idl().labels.values["team"] == "x"
@@ -1,11 +1,21 @@
 import mock
+import pytest
 
 from flytekit.tools import subprocess
 
 
 class _MockProcess(object):
-    def wait(self):
-        return 0
+    returncode = 0
+
+    def communicate(self):
+        return b"", b""
+
+
+class _MockFailedProcess(object):
+    returncode = 1
+
+    def communicate(self):
+        return b"", b"boom"
 
 
 @mock.patch.object(subprocess._subprocess, "Popen")
@@ -31,3 +41,10 @@ def test_check_call_shellex(mock_call):
     assert mock_call.call_args[1]["shell"] is True
     assert mock_call.call_args[1]["env"] == {"a": "b"}
     assert mock_call.call_args[1]["cwd"] == "/tmp"
+
+
+@mock.patch.object(subprocess._subprocess, "Popen")
+def test_check_call_failure(mock_call):
+    mock_call.return_value = _MockFailedProcess()
+    with pytest.raises(Exception, match="boom"):
+        subprocess.check_call(["ls", "-l"])